@@ -50,6 +50,7 @@ class Events(StrEnum):
     PAIRED = "paired"
     ERROR = "error"
     UPDATE = "update"
+    DATA_UPDATED = "data_updated"
     IP_ADDRESS_CHANGED = "ip_address_changed"
 
 
@@ -264,6 +265,11 @@ class DenonDevice:
         """Return true if device is active and should have an established connection."""
         return self._active
 
+    @property
+    def telnet_healthy(self) -> bool:
+        """Return True if telnet connection is enabled and healthy."""
+        return self._telnet_healthy
+
     @property
     def available(self) -> bool:
         """Return True if device is available."""
@@ -673,8 +679,8 @@ class DenonDevice:
     @staticmethod
     def _map_denonavr_state(avr_state: str | None) -> States:
         """Map the DenonAVR library state to our state."""
-        if avr_state and avr_state in DENON_STATE_MAPPING:
-            return DENON_STATE_MAPPING[avr_state]
+        if avr_state:
+            return DENON_STATE_MAPPING.get(avr_state, States.UNKNOWN)
         return States.UNKNOWN
 
     @async_handle_denonlib_errors
@@ -733,12 +739,14 @@ class DenonDevice:
         # adjust to the real volume level
         self._expected_volume = self.volume_level
 
-        # None update object means data are up to date & client can fetch required data.
-        self.events.emit(Events.UPDATE, self.id, None)
+        # data are up to date & client can fetch required data.
+        self.events.emit(Events.DATA_UPDATED, self.id)
 
     def _telnet_callback(self, zone: str, event: str, parameter: str | None) -> None:
         """Process a telnet command callback."""
-        _LOG.debug("[%s] zone: %s, event: %s, parameter: %s", self.id, zone, event, parameter)
+        # called for every received telnet event: skip the logging call if it is a no-op
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("[%s] zone: %s, event: %s, parameter: %s", self.id, zone, event, parameter)
 
         # *** Start logic from HA
         # There are multiple checks implemented which reduce unnecessary updates
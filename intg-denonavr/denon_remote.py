@@ -149,9 +149,7 @@ class DenonRemote(Remote, DenonEntity):
         :param avr_state: Denon/Marantz AVR state
         :return: UC API remote state
         """
-        if avr_state in REMOTE_STATE_MAPPING:
-            return REMOTE_STATE_MAPPING[avr_state]
-        return ucapi.remote.States.UNKNOWN
+        return REMOTE_STATE_MAPPING.get(avr_state, ucapi.remote.States.UNKNOWN)
 
     @override
     def filter_changed_attributes(self, update: dict[str, Any]) -> dict[str, Any]:
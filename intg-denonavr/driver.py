@@ -7,8 +7,10 @@ This module implements a Remote Two/3 integration driver for Denon/Marantz AVR r
 """
 
 import asyncio
+from collections.abc import Callable, Sequence
 import logging
 import os
+import sys
 from typing import Any
 
 from typing_extensions import override
@@ -23,15 +25,20 @@ import denon_select
 from entities import DenonEntity
 from i18n import _a
 import media_player
+from poller import ReceiverStatusPoller
 import sensor
 import setup_flow
 
 _LOG = logging.getLogger("driver")  # avoid having __main__ in log messages
-_LOOP = asyncio.get_event_loop()
+# create the loop explicitly: get_event_loop() without a running loop is deprecated since Python 3.12
+_LOOP = asyncio.new_event_loop()
+asyncio.set_event_loop(_LOOP)
 
 # Global variables
 api = ucapi.IntegrationAPI(_LOOP)
-# Map of avr_id -> DenonAVR instance
+# Map of avr_id -> DenonAVR instance.
+# Only modified synchronously on the event loop: iterate over a tuple snapshot of the values if the loop body awaits
+# or spawns tasks.
 _configured_avrs: dict[str, avr.DenonDevice] = {}
 # Strong refs to fire-and-forget background tasks (prevent GC while running).
 _BG_TASKS: set[asyncio.Task[Any]] = set()
@@ -39,8 +46,16 @@ _REMOTE_IN_STANDBY = False
 
 
 def _spawn(coro: Any) -> asyncio.Task[Any]:
-    """Schedule coro on the event loop and retain a strong ref until done."""
-    task = _LOOP.create_task(coro)
+    """
+    Schedule coro on the event loop and retain a strong ref until done.
+
+    On Python 3.12+ the task is started eagerly: coroutines returning without suspending, e.g. connect() on an already
+    connected receiver, complete immediately without a round-trip through the event loop scheduler.
+    """
+    if sys.version_info >= (3, 12):
+        task = asyncio.Task(coro, loop=_LOOP, eager_start=True)
+    else:
+        task = _LOOP.create_task(coro)
     _BG_TASKS.add(task)
 
     def _on_done(t: asyncio.Task[Any]) -> None:
@@ -56,29 +71,36 @@ def _spawn(coro: Any) -> asyncio.Task[Any]:
     return task
 
 
-async def receiver_status_poller(interval: float = 10.0) -> None:
-    """Receiver data poller."""
-    # TODO: is it important to delay the first call?
-    while True:
-        start_time = asyncio.get_event_loop().time()
-        if not _REMOTE_IN_STANDBY:
-            try:
-                tasks = [
-                    receiver.async_update_receiver_data() for receiver in _configured_avrs.values() if receiver.active
-                ]
-                await asyncio.gather(*tasks)
-            except (KeyError, ValueError):  # TODO check parallel access / modification while iterating a dict
-                pass
-        elapsed_time = asyncio.get_event_loop().time() - start_time
-        await asyncio.sleep(min(10.0, max(1.0, interval - elapsed_time)))
+def _receivers_to_poll() -> tuple[avr.DenonDevice, ...]:
+    """Return the receivers to poll: none while the Remote is in standby."""
+    if _REMOTE_IN_STANDBY:
+        return ()
+    return tuple(_configured_avrs.values())
+
+
+# Note: this is useful when using telnet in case the connection is unhealthy
+# and changes are made from another source
+_POLLER = ReceiverStatusPoller(_receivers_to_poll)
+
+
+async def _set_device_connected() -> None:
+    """
+    Set the integration device state to CONNECTED if it isn't already.
+
+    The integration library notifies all clients on every call, even if the state didn't change. Clients can query the
+    current state at any time.
+    """
+    if api.device_state != ucapi.DeviceStates.CONNECTED:
+        await api.set_device_state(ucapi.DeviceStates.CONNECTED)
 
 
 @api.listens_to(ucapi.Events.CONNECT)
 async def on_r2_connect_cmd() -> None:
     """Connect all configured receivers when the Remote Two/3 sends the connect command."""
     _LOG.debug("R2 connect command: connecting device(s)")
-    await api.set_device_state(ucapi.DeviceStates.CONNECTED)  # just to make sure the device state is set
-    for receiver in _configured_avrs.values():
+    # always send the device state: it's the response to the connect command
+    await api.set_device_state(ucapi.DeviceStates.CONNECTED)
+    for receiver in tuple(_configured_avrs.values()):
         # start background task
         _spawn(receiver.connect())
 
@@ -86,7 +108,7 @@ async def on_r2_connect_cmd() -> None:
 @api.listens_to(ucapi.Events.DISCONNECT)
 async def on_r2_disconnect_cmd():
     """Disconnect all configured receivers when the Remote Two/3 sends the disconnect command."""
-    for receiver in _configured_avrs.values():
+    for receiver in tuple(_configured_avrs.values()):
         # start background task
         _spawn(receiver.disconnect())
 
@@ -102,8 +124,7 @@ async def on_r2_enter_standby() -> None:
 
     _REMOTE_IN_STANDBY = True
     _LOG.debug("Enter standby event: disconnecting device(s)")
-    for configured in _configured_avrs.values():
-        await configured.disconnect()
+    await _disconnect_receivers(tuple(_configured_avrs.values()))
 
 
 @api.listens_to(ucapi.Events.EXIT_STANDBY)
@@ -118,9 +139,11 @@ async def on_r2_exit_standby() -> None:
     _REMOTE_IN_STANDBY = False
     _LOG.debug("Exit standby event: connecting device(s)")
 
-    for configured in _configured_avrs.values():
+    for configured in tuple(_configured_avrs.values()):
         # start background task
         _spawn(configured.connect())
+    # poll right away: the interval from before standby may still be backed off
+    _POLLER.wakeup()
 
 
 @api.listens_to(ucapi.Events.SUBSCRIBE_ENTITIES)
@@ -135,19 +158,23 @@ async def on_subscribe_entities(entity_ids: list[str]) -> None:
     _REMOTE_IN_STANDBY = False
     _LOG.debug("Subscribe entities event: %s", entity_ids)
     # force an entity change event with the current state for all subscribed entities
+    configured_entities = api.configured_entities
+    avr_states: dict[str, avr.States] = {}
     for entity_id in entity_ids:
         avr_id = avr_from_entity_id(entity_id)
         if avr_id is None:
             continue
-        if avr_id in _configured_avrs:
-            receiver = _configured_avrs[avr_id]
-            configured_entity = api.configured_entities.get(entity_id)
-            if configured_entity is None:
-                continue
+        receiver = _configured_avrs.get(avr_id)
+        if receiver is not None:
+            configured_entity = configured_entities.get(entity_id)
             if isinstance(configured_entity, DenonEntity):
-                state = configured_entity.state_from_avr(receiver.state)
+                # all entities of a receiver share the same AVR state: only evaluate it once
+                avr_state = avr_states.get(avr_id)
+                if avr_state is None:
+                    avr_state = avr_states[avr_id] = receiver.state
+                state = configured_entity.state_from_avr(avr_state)
                 # It doesn't matter if we use the media_player.Attributes enum. It's called the same for all entities
-                configured_entity.update_attributes({ucapi.media_player.Attributes.STATE: state}, force=True)
+                configured_entity.update_attributes({MediaAttr.STATE: state}, force=True)
             continue
 
         if config.devices is None:
@@ -181,10 +208,8 @@ async def on_unsubscribe_entities(entity_ids: list[str]) -> None:
             continue
         avrs_to_remove.discard(avr_id)
 
-    for avr_id in avrs_to_remove:
-        if avr_id in _configured_avrs:
-            await _configured_avrs[avr_id].disconnect()
-            _configured_avrs[avr_id].events.remove_all_listeners()
+    receivers = [receiver for avr_id in avrs_to_remove if (receiver := _configured_avrs.get(avr_id)) is not None]
+    await _disconnect_receivers(receivers, remove_listeners=True)
 
 
 async def on_avr_connected(avr_id: str):
@@ -195,33 +220,42 @@ async def on_avr_connected(avr_id: str):
         _LOG.warning("AVR %s is not configured", avr_id)
         return
 
-    await api.set_device_state(ucapi.DeviceStates.CONNECTED)  # just to make sure the device state is set
+    await _set_device_connected()
 
     # set the initial entity state to UNKNOWN, concrete state is set when updates are triggered / fetched
-    update: dict[str, Any] = {MediaAttr.STATE: avr.States.UNKNOWN}
-    for entity in _configured_entities_from_device(avr_id):
-        if isinstance(entity, DenonEntity):
-            entity.update_attributes(update)
+    _update_entities_state(avr_id, avr.States.UNKNOWN)
+    # fetch the concrete state right away, don't wait for the next poll cycle
+    _POLLER.wakeup()
 
 
 def on_avr_disconnected(avr_id: str):
     """Handle AVR disconnection."""
     _LOG.debug("AVR disconnected: %s", avr_id)
-    _mark_entities_unavailable(avr_id, force=True)
+    _update_entities_state(avr_id, avr.States.UNAVAILABLE, force=True)
 
 
 def on_avr_connection_error(avr_id: str, message: str) -> None:
     """Set entities of AVR to state UNAVAILABLE if AVR connection error occurred."""
     _LOG.error(message)
-    _mark_entities_unavailable(avr_id, force=False)
+    _update_entities_state(avr_id, avr.States.UNAVAILABLE)
+
 
+def _update_entities_state(avr_id: str, avr_state: avr.States, *, force: bool = False) -> None:
+    """
+    Set the state of all configured entities of the given AVR.
 
-def _mark_entities_unavailable(avr_id: str, *, force: bool):
+    :param avr_id: AVR identifier
+    :param avr_state: AVR state, converted to the state of each entity type
+    :param force: True: send the state even if it didn't change
+    """
     for entity in _configured_entities_from_device(avr_id):
-        if isinstance(entity, DenonEntity):
-            entity.update_attributes(
-                {ucapi.media_player.Attributes.STATE: ucapi.media_player.States.UNAVAILABLE}, force=force
-            )
+        if not isinstance(entity, DenonEntity):
+            continue
+        # It doesn't matter if we use the media_player.Attributes enum. It's called the same for all entities
+        if force:
+            entity.update_attributes({MediaAttr.STATE: entity.state_from_avr(avr_state)}, force=True)
+        else:
+            entity.update_attributes({MediaAttr.STATE: avr_state})
 
 
 def handle_avr_address_change(avr_id: str, address: str) -> None:
@@ -235,77 +269,118 @@ def handle_avr_address_change(avr_id: str, address: str) -> None:
         config.devices.update(device)
 
 
-def on_avr_update(avr_id: str, update: dict[str, Any] | None) -> None:
+def on_avr_update(avr_id: str, update: dict[str, Any]) -> None:
     """
-    Update attributes of configured media-player entity if AVR properties changed.
+    Update attributes of configured entities if AVR properties changed.
 
     :param avr_id: AVR identifier
-    :param update: dictionary containing the updated properties or None if
+    :param update: dictionary containing the updated properties
     """
-    if update is None:
-        if avr_id not in _configured_avrs:
-            return
-        receiver = _configured_avrs[avr_id]
-        update = {
-            MediaAttr.STATE: receiver.state,
-            MediaAttr.MEDIA_ARTIST: receiver.media_artist,
-            MediaAttr.MEDIA_ALBUM: receiver.media_album_name,
-            MediaAttr.MEDIA_IMAGE_URL: receiver.media_image_url,
-            MediaAttr.MEDIA_TITLE: receiver.media_title,
-            MediaAttr.MUTED: receiver.is_volume_muted,
-            MediaAttr.SOURCE: receiver.source,
-            MediaAttr.SOURCE_LIST: receiver.source_list,
-            MediaAttr.SOUND_MODE: receiver.sound_mode,
-            AdditionalEventType.RAW_SOUND_MODE: receiver.sound_mode_raw,
-            MediaAttr.SOUND_MODE_LIST: receiver.sound_mode_list,
-            MediaAttr.VOLUME: receiver.volume_level,
-            AdditionalEventType.SLEEP_TIMER: receiver.sleep,
-            AdditionalEventType.AUDIO_DELAY: receiver.audio_delay,
-            AdditionalEventType.MONITOR: receiver.video_output,
-            AdditionalEventType.DIMMER: receiver.dimmer,
-            AdditionalEventType.ECO_MODE: receiver.eco_mode,
-            AdditionalEventType.VIDEO_SIGNAL_IN: receiver.video_hdmi_signal_in,
-            AdditionalEventType.VIDEO_SIGNAL_OUT: receiver.video_hdmi_signal_out,
-            AdditionalEventType.AUDIO_SAMPLING_RATE: receiver.audio_sampling_rate,
-            AdditionalEventType.AUDIO_SIGNAL: receiver.audio_signal,
-            AdditionalEventType.AUDIO_SOUND: receiver.audio_sound,
-            AdditionalEventType.INPUT_CHANNELS: receiver.input_channels,
-            AdditionalEventType.OUTPUT_CHANNELS: receiver.output_channels,
-            AdditionalEventType.MAX_RESOLUTION: receiver.max_resolution,
-            AdditionalEventType.HDR_INPUT: receiver.hdr_input,
-            AdditionalEventType.HDR_OUTPUT: receiver.hdr_output,
-            AdditionalEventType.PIXEL_DEPTH_INPUT: receiver.pixel_depth_input,
-            AdditionalEventType.PIXEL_DEPTH_OUTPUT: receiver.pixel_depth_output,
-            AdditionalEventType.MAX_FRL_INPUT: receiver.max_frl_input,
-            AdditionalEventType.MAX_FRL_OUTPUT: receiver.max_frl_output,
-            AdditionalEventType.PICTURE_MODE: receiver.picture_mode,
-            AdditionalEventType.TUNER_FREQUENCY: receiver.tuner_frequency,
-            AdditionalEventType.ALL_ZONE_STEREO: receiver.all_zone_stereo,
-            AdditionalEventType.DIGITAL_CODEC: receiver.digital_codec,
-        }
-    else:
+    entities = _configured_denon_entities(avr_id)
+    if not entities:
+        return
+
+    if _LOG.isEnabledFor(logging.INFO):
         _LOG.info("[%s] AVR update: %s", avr_id, update)
 
-    for entity in _configured_entities_from_device(avr_id):
-        if isinstance(entity, DenonEntity):
-            entity.update_attributes(update)
+    for entity in entities:
+        entity.update_attributes(update)
+
+
+def on_avr_data_updated(avr_id: str) -> None:
+    """
+    Update attributes of configured entities from the current AVR data after a status update.
+
+    :param avr_id: AVR identifier
+    """
+    entities = _configured_denon_entities(avr_id)
+    if not entities:
+        # nobody is interested in the update: skip building the full receiver snapshot
+        return
+    receiver = _configured_avrs.get(avr_id)
+    if receiver is None:
+        return
+
+    update: dict[str, Any] = {
+        MediaAttr.STATE: receiver.state,
+        MediaAttr.MEDIA_ARTIST: receiver.media_artist,
+        MediaAttr.MEDIA_ALBUM: receiver.media_album_name,
+        MediaAttr.MEDIA_IMAGE_URL: receiver.media_image_url,
+        MediaAttr.MEDIA_TITLE: receiver.media_title,
+        MediaAttr.MUTED: receiver.is_volume_muted,
+        MediaAttr.SOURCE: receiver.source,
+        MediaAttr.SOURCE_LIST: receiver.source_list,
+        MediaAttr.SOUND_MODE: receiver.sound_mode,
+        AdditionalEventType.RAW_SOUND_MODE: receiver.sound_mode_raw,
+        MediaAttr.SOUND_MODE_LIST: receiver.sound_mode_list,
+        MediaAttr.VOLUME: receiver.volume_level,
+        AdditionalEventType.SLEEP_TIMER: receiver.sleep,
+        AdditionalEventType.AUDIO_DELAY: receiver.audio_delay,
+        AdditionalEventType.MONITOR: receiver.video_output,
+        AdditionalEventType.DIMMER: receiver.dimmer,
+        AdditionalEventType.ECO_MODE: receiver.eco_mode,
+        AdditionalEventType.VIDEO_SIGNAL_IN: receiver.video_hdmi_signal_in,
+        AdditionalEventType.VIDEO_SIGNAL_OUT: receiver.video_hdmi_signal_out,
+        AdditionalEventType.AUDIO_SAMPLING_RATE: receiver.audio_sampling_rate,
+        AdditionalEventType.AUDIO_SIGNAL: receiver.audio_signal,
+        AdditionalEventType.AUDIO_SOUND: receiver.audio_sound,
+        AdditionalEventType.INPUT_CHANNELS: receiver.input_channels,
+        AdditionalEventType.OUTPUT_CHANNELS: receiver.output_channels,
+        AdditionalEventType.MAX_RESOLUTION: receiver.max_resolution,
+        AdditionalEventType.HDR_INPUT: receiver.hdr_input,
+        AdditionalEventType.HDR_OUTPUT: receiver.hdr_output,
+        AdditionalEventType.PIXEL_DEPTH_INPUT: receiver.pixel_depth_input,
+        AdditionalEventType.PIXEL_DEPTH_OUTPUT: receiver.pixel_depth_output,
+        AdditionalEventType.MAX_FRL_INPUT: receiver.max_frl_input,
+        AdditionalEventType.MAX_FRL_OUTPUT: receiver.max_frl_output,
+        AdditionalEventType.PICTURE_MODE: receiver.picture_mode,
+        AdditionalEventType.TUNER_FREQUENCY: receiver.tuner_frequency,
+        AdditionalEventType.ALL_ZONE_STEREO: receiver.all_zone_stereo,
+        AdditionalEventType.DIGITAL_CODEC: receiver.digital_codec,
+    }
+
+    for entity in entities:
+        entity.update_attributes(update)
+
+
+def _configured_denon_entities(avr_id: str) -> list[DenonEntity]:
+    """
+    Return all configured Denon entities of the given device.
+
+    :param avr_id: the avr identifier
+    :return: list of configured entities handling AVR updates
+    """
+    return [entity for entity in _configured_entities_from_device(avr_id) if isinstance(entity, DenonEntity)]
 
 
-MAPPED_AVR_ENTITIES = {}
+# Driver handlers of the internal AVR events, registered for every configured receiver
+_AVR_EVENT_HANDLERS: tuple[tuple[avr.Events, Callable[..., Any]], ...] = (
+    (avr.Events.CONNECTED, on_avr_connected),
+    (avr.Events.DISCONNECTED, on_avr_disconnected),
+    (avr.Events.ERROR, on_avr_connection_error),
+    (avr.Events.UPDATE, on_avr_update),
+    (avr.Events.DATA_UPDATED, on_avr_data_updated),
+    (avr.Events.IP_ADDRESS_CHANGED, handle_avr_address_change),
+)
 
+# Cache of avr_id -> entity identifiers of the AVR
+MAPPED_AVR_ENTITIES: dict[str, tuple[str, ...]] = {}
 
-def _entities_from_avr(avr_id: str) -> list[str]:
+
+def _entities_from_avr(avr_id: str) -> tuple[str, ...]:
     """
     Return all associated entity identifiers of the given AVR.
 
+    The identifiers are cached per AVR, the returned tuple is shared between all callers.
+
     :param avr_id: the AVR identifier
-    :return: list of entity identifiers
+    :return: entity identifiers
     """
     # dead simple for now: one media_player entity per device!
     # TODO #21 support multiple zones: one media-player per zone
     avr_entities = MAPPED_AVR_ENTITIES.get(avr_id)
     if avr_entities is None:
-        avr_entities = [
+        avr_entities = (
             create_entity_id(avr_id, ucapi.EntityTypes.MEDIA_PLAYER),
             create_entity_id(avr_id, ucapi.EntityTypes.REMOTE),
             *(create_entity_id(avr_id, ucapi.EntityTypes.SENSOR, sensor_type.value) for sensor_type in SensorType),
@@ -313,7 +388,7 @@ def _entities_from_avr(avr_id: str) -> list[str]:
                 create_entity_id(avr_id, ucapi.EntityTypes.SELECT, select_type.value)
                 for select_type in config.SelectType
             ),
-        ]
+        )
         MAPPED_AVR_ENTITIES[avr_id] = avr_entities
     return avr_entities
 
@@ -335,11 +410,8 @@ def _configure_new_avr(device: config.AvrDevice, *, connect: bool = True) -> Non
     else:
         receiver = avr.DenonDevice(device, loop=_LOOP)
 
-        receiver.events.on(avr.Events.CONNECTED, on_avr_connected)
-        receiver.events.on(avr.Events.DISCONNECTED, on_avr_disconnected)
-        receiver.events.on(avr.Events.ERROR, on_avr_connection_error)
-        receiver.events.on(avr.Events.UPDATE, on_avr_update)
-        receiver.events.on(avr.Events.IP_ADDRESS_CHANGED, handle_avr_address_change)
+        for event, handler in _AVR_EVENT_HANDLERS:
+            receiver.events.on(event, handler)
 
         _configured_avrs[device.id] = receiver
 
@@ -376,7 +448,7 @@ def _register_available_entities(device: config.AvrDevice, receiver: avr.DenonDe
 def on_device_added(device: config.AvrDevice) -> None:
     """Handle a newly added device in the configuration."""
     _LOG.debug("New device added: %s", device)
-    _spawn(api.set_device_state(ucapi.DeviceStates.CONNECTED))  # just to make sure the device state is set
+    _spawn(_set_device_connected())
     _configure_new_avr(device, connect=False)
 
 
@@ -384,9 +456,10 @@ def on_device_removed(device: config.AvrDevice | None) -> None:
     """Handle a removed device in the configuration."""
     if device is None:
         _LOG.debug("Configuration cleared, disconnecting & removing all configured AVR instances")
-        for configured in _configured_avrs.values():
+        for configured in tuple(_configured_avrs.values()):
             _spawn(_async_remove(configured))
         _configured_avrs.clear()
+        MAPPED_AVR_ENTITIES.clear()
         api.configured_entities.clear()
         api.available_entities.clear()
     elif device.id in _configured_avrs:
@@ -396,6 +469,7 @@ def on_device_removed(device: config.AvrDevice | None) -> None:
         for entity_id in _entities_from_avr(configured.id):
             api.configured_entities.remove(entity_id)
             api.available_entities.remove(entity_id)
+        MAPPED_AVR_ENTITIES.pop(configured.id, None)
 
 
 async def _async_remove(receiver: avr.DenonDevice) -> None:
@@ -404,6 +478,22 @@ async def _async_remove(receiver: avr.DenonDevice) -> None:
     receiver.events.remove_all_listeners()
 
 
+async def _disconnect_receivers(receivers: Sequence[avr.DenonDevice], *, remove_listeners: bool = False) -> None:
+    """
+    Disconnect from the given receivers concurrently.
+
+    An unreachable receiver doesn't delay the disconnection of the others. Failures are logged.
+
+    :param receivers: receivers to disconnect.
+    :param remove_listeners: True: remove all event listeners of the receivers after disconnecting.
+    """
+    disconnect = _async_remove if remove_listeners else avr.DenonDevice.disconnect
+    results = await asyncio.gather(*(disconnect(receiver) for receiver in receivers), return_exceptions=True)
+    for receiver, result in zip(receivers, results, strict=True):
+        if isinstance(result, Exception):
+            _LOG.error("[%s] Failed to disconnect AVR: %s", receiver.id, result)
+
+
 def _configured_entities_from_device(avr_id: str) -> list[ucapi.Entity]:
     """
     Return all configured entities of the given device.
@@ -411,12 +501,22 @@ def _configured_entities_from_device(avr_id: str) -> list[ucapi.Entity]:
     :param avr_id: the avr identifier
     :return: list of configured entities
     """
-    entities = []
-    for entity_id in _entities_from_avr(avr_id):
-        configured_entity = api.configured_entities.get(entity_id)
-        if configured_entity:
-            entities.append(configured_entity)
-    return entities
+    get_entity = api.configured_entities.get
+    return [entity for entity_id in _entities_from_avr(avr_id) if (entity := get_entity(entity_id))]
+
+
+# Loggers using the configured UC_LOG_LEVEL
+_LOGGER_NAMES = (
+    "denonavr.ssdp",
+    "avr",
+    "denon_remote",
+    "discover",
+    "driver",
+    "media_player",
+    "receiver",
+    "setup_flow",
+    "sensor",
+)
 
 
 class JournaldFormatter(logging.Formatter):
@@ -454,24 +554,15 @@ async def main():
         )
 
     level = os.getenv("UC_LOG_LEVEL", "DEBUG").upper()
-    logging.getLogger("denonavr.ssdp").setLevel(level)
     logging.getLogger("denonavr").setLevel("INFO")
-    logging.getLogger("avr").setLevel(level)
-    logging.getLogger("denon_remote").setLevel(level)
-    logging.getLogger("discover").setLevel(level)
-    logging.getLogger("driver").setLevel(level)
-    logging.getLogger("media_player").setLevel(level)
-    logging.getLogger("receiver").setLevel(level)
-    logging.getLogger("setup_flow").setLevel(level)
-    logging.getLogger("sensor").setLevel(level)
+    for name in _LOGGER_NAMES:
+        logging.getLogger(name).setLevel(level)
 
     config.devices = config.Devices(api.config_dir_path, on_device_added, on_device_removed)
     for device in config.devices.all():
         _configure_new_avr(device, connect=False)
 
-    # Note: this is useful when using telnet in case the connection is unhealthy
-    # and changes are made from another source
-    _spawn(receiver_status_poller())
+    _spawn(_POLLER.run())
 
     await api.init("driver.json", setup_flow.driver_setup_handler)
 
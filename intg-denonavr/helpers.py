@@ -7,6 +7,8 @@ Helper functions.
 
 from typing import Any
 
+_MISSING = object()
+
 
 def key_update_helper(
     key: str,
@@ -18,10 +20,7 @@ def key_update_helper(
     if value is None:
         return attributes
 
-    if key in original_attributes:
-        if original_attributes[key] != value:
-            attributes[key] = value
-    else:
+    if original_attributes.get(key, _MISSING) != value:
         attributes[key] = value
 
     return attributes
@@ -5,8 +5,9 @@ Media-player entity functions.
 :license: Mozilla Public License Version 2.0, see LICENSE for more details.
 """
 
+from collections.abc import Awaitable, Callable
 import logging
-from typing import Any
+from typing import Any, ClassVar
 
 from typing_extensions import override
 from ucapi import EntityTypes, IntegrationAPI, MediaPlayer, StatusCodes
@@ -30,59 +31,107 @@ MEDIA_PLAYER_STATE_MAPPING = {
     avr.States.UNKNOWN: States.UNKNOWN,
 }
 
+# Media-player attributes taken over as-is from an AVR update if changed
+TRACKED_ATTRIBUTES = (
+    Attributes.MEDIA_ARTIST,
+    Attributes.MEDIA_ALBUM,
+    Attributes.MEDIA_IMAGE_URL,
+    Attributes.MEDIA_TITLE,
+    Attributes.MUTED,
+    Attributes.SOURCE,
+    Attributes.VOLUME,
+)
+
+# Mapping of a media-player command to the receiver function handling it.
+# Commands not contained in this table are sent as simple commands.
+COMMAND_HANDLERS: dict[str, Callable[[avr.DenonDevice, dict[str, Any]], Awaitable[StatusCodes]]] = {
+    Commands.PLAY_PAUSE: lambda receiver, _: receiver.play_pause(),
+    Commands.STOP: lambda receiver, _: receiver.stop(),
+    Commands.NEXT: lambda receiver, _: receiver.next(),
+    Commands.PREVIOUS: lambda receiver, _: receiver.previous(),
+    Commands.VOLUME: lambda receiver, params: receiver.set_volume_level(params.get("volume")),
+    Commands.VOLUME_UP: lambda receiver, _: receiver.volume_up(),
+    Commands.VOLUME_DOWN: lambda receiver, _: receiver.volume_down(),
+    Commands.MUTE_TOGGLE: lambda receiver, _: receiver.mute_toggle(),
+    Commands.MUTE: lambda receiver, _: receiver.mute(muted=True),
+    Commands.UNMUTE: lambda receiver, _: receiver.mute(muted=False),
+    Commands.ON: lambda receiver, _: receiver.power_on(),
+    Commands.OFF: lambda receiver, _: receiver.power_off(),
+    Commands.TOGGLE: lambda receiver, _: receiver.power_toggle(),
+    Commands.SELECT_SOURCE: lambda receiver, params: receiver.select_source(params.get("source")),
+    Commands.SELECT_SOUND_MODE: lambda receiver, params: receiver.select_sound_mode(params.get("mode")),
+    Commands.CURSOR_UP: lambda receiver, _: receiver.cursor_up(),
+    Commands.CURSOR_DOWN: lambda receiver, _: receiver.cursor_down(),
+    Commands.CURSOR_LEFT: lambda receiver, _: receiver.cursor_left(),
+    Commands.CURSOR_RIGHT: lambda receiver, _: receiver.cursor_right(),
+    Commands.CURSOR_ENTER: lambda receiver, _: receiver.cursor_enter(),
+    Commands.BACK: lambda receiver, _: receiver.back(),
+    Commands.MENU: lambda receiver, _: receiver.setup(),
+    Commands.CONTEXT_MENU: lambda receiver, _: receiver.options(),
+    Commands.INFO: lambda receiver, _: receiver.info(),
+    Commands.CHANNEL_UP: lambda receiver, _: receiver.channel_up(),
+    Commands.CHANNEL_DOWN: lambda receiver, _: receiver.channel_down(),
+}
+
 
 class DenonMediaPlayer(MediaPlayer, DenonEntity):
     """Representation of a Denon/Marantz Media Player entity."""
 
+    # Features and initial attributes of all media-players, independent of the device configuration
+    _FEATURES_BASE: ClassVar[tuple[Features, ...]] = (
+        Features.ON_OFF,
+        Features.TOGGLE,
+        Features.VOLUME,
+        Features.VOLUME_UP_DOWN,
+        Features.MUTE_TOGGLE,
+        Features.MUTE,
+        Features.UNMUTE,
+        Features.PLAY_PAUSE,
+        Features.NEXT,
+        Features.PREVIOUS,
+        Features.MEDIA_TITLE,
+        Features.MEDIA_ARTIST,
+        Features.MEDIA_ALBUM,
+        Features.MEDIA_IMAGE_URL,
+        Features.MEDIA_TYPE,
+        Features.SELECT_SOURCE,
+        Features.DPAD,
+        Features.MENU,
+        Features.CONTEXT_MENU,
+        Features.INFO,
+        Features.CHANNEL_SWITCHER,
+    )
+    # Only immutable values: the dictionary is shallow-copied for every instance
+    _ATTRIBUTES_BASE: ClassVar[dict[str, Any]] = {
+        Attributes.STATE: States.UNAVAILABLE,
+        Attributes.VOLUME: 0,
+        Attributes.MUTED: False,
+        Attributes.MEDIA_IMAGE_URL: "",
+        Attributes.MEDIA_TITLE: "",
+        Attributes.MEDIA_ARTIST: "",
+        Attributes.MEDIA_ALBUM: "",
+        Attributes.SOURCE: "",
+    }
+
     def __init__(self, device: AvrDevice, receiver: avr.DenonDevice, api: IntegrationAPI):
         """Initialize the class."""
         self._receiver: avr.DenonDevice = receiver
         self._device: AvrDevice = device
         entity_id = create_entity_id(receiver.id, EntityTypes.MEDIA_PLAYER)
-        features = [
-            Features.ON_OFF,
-            Features.TOGGLE,
-            Features.VOLUME,
-            Features.VOLUME_UP_DOWN,
-            Features.MUTE_TOGGLE,
-            Features.MUTE,
-            Features.UNMUTE,
-            Features.PLAY_PAUSE,
-            Features.NEXT,
-            Features.PREVIOUS,
-            Features.MEDIA_TITLE,
-            Features.MEDIA_ARTIST,
-            Features.MEDIA_ALBUM,
-            Features.MEDIA_IMAGE_URL,
-            Features.MEDIA_TYPE,
-            Features.SELECT_SOURCE,
-            Features.DPAD,
-            Features.MENU,
-            Features.CONTEXT_MENU,
-            Features.INFO,
-            Features.CHANNEL_SWITCHER,
-        ]
-        attributes: dict[str, Any] = {
-            Attributes.STATE: States.UNAVAILABLE,
-            Attributes.VOLUME: 0,
-            Attributes.MUTED: False,
-            Attributes.MEDIA_IMAGE_URL: "",
-            Attributes.MEDIA_TITLE: "",
-            Attributes.MEDIA_ARTIST: "",
-            Attributes.MEDIA_ALBUM: "",
-            Attributes.SOURCE: "",
-            Attributes.SOURCE_LIST: [],
-        }
+        attributes = dict(self._ATTRIBUTES_BASE)
+        attributes[Attributes.SOURCE_LIST] = []
+        extra_features: tuple[Features, ...] = ()
         # use sound mode support & name from configuration: receiver might not yet be connected
         if device.support_sound_mode:
-            features.append(Features.SELECT_SOUND_MODE)
+            extra_features += (Features.SELECT_SOUND_MODE,)
             attributes[Attributes.SOUND_MODE] = ""
             attributes[Attributes.SOUND_MODE_LIST] = []
 
         self.simple_commands = simplecommand.get_simple_commands(device)
         # Denon has additional simple commands
         if device.is_denon:
-            features.append(Features.STOP)
+            extra_features += (Features.STOP,)
+        features = list(self._FEATURES_BASE + extra_features)
 
         options: dict[str, Any] = {Options.SIMPLE_COMMANDS: self.simple_commands}
 
@@ -116,63 +165,10 @@ class DenonMediaPlayer(MediaPlayer, DenonEntity):
         """
         _LOG.info("Got %s command request: %s %s", self.id, cmd_id, params)
 
-        params = params or {}
-
-        match cmd_id:
-            case Commands.PLAY_PAUSE:
-                return await self._receiver.play_pause()
-            case Commands.STOP:
-                return await self._receiver.stop()
-            case Commands.NEXT:
-                return await self._receiver.next()
-            case Commands.PREVIOUS:
-                return await self._receiver.previous()
-            case Commands.VOLUME:
-                return await self._receiver.set_volume_level(params.get("volume"))
-            case Commands.VOLUME_UP:
-                return await self._receiver.volume_up()
-            case Commands.VOLUME_DOWN:
-                return await self._receiver.volume_down()
-            case Commands.MUTE_TOGGLE:
-                return await self._receiver.mute_toggle()
-            case Commands.MUTE:
-                return await self._receiver.mute(muted=True)
-            case Commands.UNMUTE:
-                return await self._receiver.mute(muted=False)
-            case Commands.ON:
-                return await self._receiver.power_on()
-            case Commands.OFF:
-                return await self._receiver.power_off()
-            case Commands.TOGGLE:
-                return await self._receiver.power_toggle()
-            case Commands.SELECT_SOURCE:
-                return await self._receiver.select_source(params.get("source"))
-            case Commands.SELECT_SOUND_MODE:
-                return await self._receiver.select_sound_mode(params.get("mode"))
-            case Commands.CURSOR_UP:
-                return await self._receiver.cursor_up()
-            case Commands.CURSOR_DOWN:
-                return await self._receiver.cursor_down()
-            case Commands.CURSOR_LEFT:
-                return await self._receiver.cursor_left()
-            case Commands.CURSOR_RIGHT:
-                return await self._receiver.cursor_right()
-            case Commands.CURSOR_ENTER:
-                return await self._receiver.cursor_enter()
-            case Commands.BACK:
-                return await self._receiver.back()
-            case Commands.MENU:
-                return await self._receiver.setup()
-            case Commands.CONTEXT_MENU:
-                return await self._receiver.options()
-            case Commands.INFO:
-                return await self._receiver.info()
-            case Commands.CHANNEL_UP:
-                return await self._receiver.channel_up()
-            case Commands.CHANNEL_DOWN:
-                return await self._receiver.channel_down()
-            case _:
-                return await self._receiver.send_simple_command(cmd_id)
+        handler = COMMAND_HANDLERS.get(cmd_id)
+        if handler is None:
+            return await self._receiver.send_simple_command(cmd_id)
+        return await handler(self._receiver, params or {})
 
     def get_supported_commands(self, *, include_power_state_commands: bool) -> list[str]:
         """
@@ -205,7 +201,7 @@ class DenonMediaPlayer(MediaPlayer, DenonEntity):
             Commands.CONTEXT_MENU,
             Commands.INFO,
             *power_state_commands,
-            *simplecommand.get_simple_commands(self._device),
+            *self.simple_commands,
         ]
 
     @override
@@ -217,22 +213,15 @@ class DenonMediaPlayer(MediaPlayer, DenonEntity):
         :return: filtered entity attributes containing changed attributes only.
         """
         attributes = {}
+        original_attributes = self.attributes
 
         if Attributes.STATE in update:
             state = self.state_from_avr(update[Attributes.STATE])
-            attributes = helpers.key_update_helper(Attributes.STATE, state, attributes, self.attributes)
+            attributes = helpers.key_update_helper(Attributes.STATE, state, attributes, original_attributes)
 
-        for attr in [
-            Attributes.MEDIA_ARTIST,
-            Attributes.MEDIA_ALBUM,
-            Attributes.MEDIA_IMAGE_URL,
-            Attributes.MEDIA_TITLE,
-            Attributes.MUTED,
-            Attributes.SOURCE,
-            Attributes.VOLUME,
-        ]:
-            if attr in update:
-                attributes = helpers.key_update_helper(attr, update[attr], attributes, self.attributes)
+        for attr in TRACKED_ATTRIBUTES:
+            # key_update_helper ignores None values: no need to check for the key first
+            attributes = helpers.key_update_helper(attr, update.get(attr), attributes, original_attributes)
 
         if (
             Attributes.SOURCE_LIST in update
@@ -271,6 +260,4 @@ class DenonMediaPlayer(MediaPlayer, DenonEntity):
         :param avr_state: Denon/Marantz AVR state
         :return: UC API media_player state
         """
-        if avr_state in MEDIA_PLAYER_STATE_MAPPING:
-            return MEDIA_PLAYER_STATE_MAPPING[avr_state]
-        return States.UNKNOWN
+        return MEDIA_PLAYER_STATE_MAPPING.get(avr_state, States.UNKNOWN)
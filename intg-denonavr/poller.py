@@ -0,0 +1,105 @@
+"""
+Receiver status poller with an adaptive poll interval.
+
+:copyright: (c) 2025 by Unfolded Circle ApS.
+:license: Mozilla Public License Version 2.0, see LICENSE for more details.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+import contextlib
+import random
+from typing import Protocol
+
+POLL_MIN_INTERVAL: float = 10.0
+"""Receiver status poll interval if a receiver requires polling, in seconds."""
+POLL_MAX_INTERVAL: float = 60.0
+"""Maximum receiver status poll interval while all receivers are connected with healthy telnet, in seconds."""
+POLL_BACKOFF_FACTOR: float = 1.5
+"""Poll interval multiplier for every poll cycle in which no receiver required polling."""
+
+
+class PolledReceiver(Protocol):
+    """Receiver interface required by the status poller."""
+
+    id: str
+
+    @property
+    def active(self) -> bool:
+        """Return true if the receiver should have an established connection."""
+        ...
+
+    @property
+    def telnet_healthy(self) -> bool:
+        """Return True if telnet connection is enabled and healthy."""
+        ...
+
+    def async_update_receiver_data(self) -> Awaitable[object]:
+        """Get the latest status information from the receiver."""
+        ...
+
+
+class ReceiverStatusPoller:
+    """
+    Periodically update the status of all active receivers.
+
+    The poll interval is increased up to the maximal interval while all active receivers have a healthy telnet
+    connection, which pushes state changes. It is reset to the minimal interval if no receiver is active, an active
+    receiver doesn't have a healthy telnet connection, or the set of active receivers changed since the last cycle.
+    """
+
+    def __init__(
+        self,
+        receivers: Callable[[], Iterable[PolledReceiver]],
+        *,
+        min_interval: float = POLL_MIN_INTERVAL,
+        max_interval: float = POLL_MAX_INTERVAL,
+    ):
+        """
+        Create a status poller.
+
+        :param receivers: returns the receivers to poll. Called at the start of every cycle.
+        :param min_interval: minimal poll interval in seconds.
+        :param max_interval: maximal poll interval in seconds.
+        """
+        self._receivers = receivers
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._interval = min_interval
+        self._active_ids: frozenset[str] = frozenset()
+        self._wakeup = asyncio.Event()
+
+    @property
+    def interval(self) -> float:
+        """Return the current poll interval in seconds, without jitter."""
+        return self._interval
+
+    def wakeup(self) -> None:
+        """Start the next poll cycle immediately, e.g. after a receiver (re)connected."""
+        self._wakeup.set()
+
+    async def poll(self) -> None:
+        """Update the status of all active receivers once and adjust the poll interval."""
+        # snapshot the receivers: the source can be modified by event handlers while the updates are awaited
+        receivers = tuple(receiver for receiver in self._receivers() if receiver.active)
+        await asyncio.gather(*(receiver.async_update_receiver_data() for receiver in receivers))
+
+        active_ids = frozenset(receiver.id for receiver in receivers)
+        if receivers and active_ids == self._active_ids and all(receiver.telnet_healthy for receiver in receivers):
+            self._interval = min(self._interval * POLL_BACKOFF_FACTOR, self._max_interval)
+        else:
+            self._interval = self._min_interval
+        self._active_ids = active_ids
+
+    async def run(self) -> None:
+        """Poll the receivers until cancelled."""
+        clock = asyncio.get_running_loop().time
+        while True:
+            start_time = clock()
+            await self.poll()
+            elapsed_time = clock() - start_time
+            # add some jitter to avoid synchronized update requests with other clients of the receivers
+            delay = self._interval * random.uniform(0.8, 1.2)  # noqa: S311
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), max(1.0, delay - elapsed_time))
+            self._wakeup.clear()
@@ -7,6 +7,7 @@ This module implements the Denon/Marantz AVR receiver communication of the Remot
 
 from collections.abc import Awaitable, Callable
 from enum import Enum
+from functools import cache
 
 import denonavr
 import ucapi
@@ -462,16 +463,25 @@ ALL_COMMANDS: dict[str, tuple[DeviceProtocol, DeviceType]] = {
 }
 
 
-def get_simple_commands(device: AvrDevice):
-    """Get the list of simple commands for the given device."""
-    allowed_types = {DeviceType.ALL, DeviceType.DENON} if device.is_denon else {DeviceType.ALL, DeviceType.MARANTZ}
-    allowed_protocols = {DeviceProtocol.ALL, DeviceProtocol.TELNET} if device.use_telnet else {DeviceProtocol.ALL}
+def get_simple_commands(device: AvrDevice) -> tuple[str, ...]:
+    """
+    Get the simple commands for the given device.
 
-    return [
+    The returned tuple is shared between all devices of the same type and protocol.
+    """
+    return _get_simple_commands(is_denon=device.is_denon, use_telnet=device.use_telnet)
+
+
+@cache
+def _get_simple_commands(*, is_denon: bool, use_telnet: bool) -> tuple[str, ...]:
+    allowed_types = {DeviceType.ALL, DeviceType.DENON} if is_denon else {DeviceType.ALL, DeviceType.MARANTZ}
+    allowed_protocols = {DeviceProtocol.ALL, DeviceProtocol.TELNET} if use_telnet else {DeviceProtocol.ALL}
+
+    return tuple(
         cmd
         for cmd, (protocol, device_type) in ALL_COMMANDS.items()
         if protocol in allowed_protocols and device_type in allowed_types
-    ]
+    )
 
 
 class SimpleCommand:
@@ -0,0 +1,50 @@
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock
+
+from ucapi import StatusCodes
+from ucapi.media_player import Commands
+
+from media_player import DenonMediaPlayer
+
+
+class TestDenonMediaPlayerCommand(IsolatedAsyncioTestCase):
+    def _build_media_player(self):
+        media_player = DenonMediaPlayer.__new__(DenonMediaPlayer)
+        media_player.id = "media_player.test"
+        receiver_mock = AsyncMock()
+        media_player._receiver = receiver_mock
+        return media_player, receiver_mock
+
+    async def test_command_without_params(self):
+        media_player, mock = self._build_media_player()
+        mock.play_pause.return_value = StatusCodes.OK
+        result = await media_player.command(Commands.PLAY_PAUSE, websocket=None)
+        self.assertEqual(StatusCodes.OK, result)
+        mock.play_pause.assert_awaited_once_with()
+
+    async def test_command_with_params(self):
+        media_player, mock = self._build_media_player()
+        mock.set_volume_level.return_value = StatusCodes.OK
+        result = await media_player.command(Commands.VOLUME, {"volume": 42}, websocket=None)
+        self.assertEqual(StatusCodes.OK, result)
+        mock.set_volume_level.assert_awaited_once_with(42)
+
+    async def test_command_with_missing_params(self):
+        media_player, mock = self._build_media_player()
+        mock.select_source.return_value = StatusCodes.BAD_REQUEST
+        result = await media_player.command(Commands.SELECT_SOURCE, None, websocket=None)
+        self.assertEqual(StatusCodes.BAD_REQUEST, result)
+        mock.select_source.assert_awaited_once_with(None)
+
+    async def test_command_with_keyword_argument(self):
+        media_player, mock = self._build_media_player()
+        mock.mute.return_value = StatusCodes.OK
+        await media_player.command(Commands.UNMUTE, websocket=None)
+        mock.mute.assert_awaited_once_with(muted=False)
+
+    async def test_unknown_command_is_sent_as_simple_command(self):
+        media_player, mock = self._build_media_player()
+        mock.send_simple_command.return_value = StatusCodes.NOT_IMPLEMENTED
+        result = await media_player.command("UNKNOWN_COMMAND", websocket=None)
+        self.assertEqual(StatusCodes.NOT_IMPLEMENTED, result)
+        mock.send_simple_command.assert_awaited_once_with("UNKNOWN_COMMAND")
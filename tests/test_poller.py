@@ -0,0 +1,81 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock
+
+from poller import POLL_BACKOFF_FACTOR, ReceiverStatusPoller
+
+
+class FakeReceiver:
+    def __init__(self, receiver_id, *, active=True, telnet_healthy=True):
+        self.id = receiver_id
+        self.active = active
+        self.telnet_healthy = telnet_healthy
+        self.async_update_receiver_data = AsyncMock()
+
+
+class TestReceiverStatusPoller(IsolatedAsyncioTestCase):
+    def _build_poller(self, receivers):
+        return ReceiverStatusPoller(lambda: receivers, min_interval=10.0, max_interval=60.0)
+
+    async def test_poll_updates_active_receivers_only(self):
+        active = FakeReceiver("avr1")
+        inactive = FakeReceiver("avr2", active=False)
+        poller = self._build_poller([active, inactive])
+        await poller.poll()
+        active.async_update_receiver_data.assert_awaited_once()
+        inactive.async_update_receiver_data.assert_not_awaited()
+
+    async def test_backoff_while_telnet_healthy(self):
+        poller = self._build_poller([FakeReceiver("avr1"), FakeReceiver("avr2")])
+        await poller.poll()
+        self.assertEqual(10.0, poller.interval, "Expected minimal interval after first poll of new receivers")
+        await poller.poll()
+        self.assertEqual(10.0 * POLL_BACKOFF_FACTOR, poller.interval)
+        await poller.poll()
+        self.assertEqual(10.0 * POLL_BACKOFF_FACTOR**2, poller.interval)
+
+    async def test_backoff_is_capped(self):
+        poller = self._build_poller([FakeReceiver("avr1")])
+        for _ in range(20):
+            await poller.poll()
+        self.assertEqual(60.0, poller.interval)
+
+    async def test_reset_on_unhealthy_receiver(self):
+        receiver = FakeReceiver("avr1")
+        poller = self._build_poller([receiver])
+        for _ in range(5):
+            await poller.poll()
+        self.assertGreater(poller.interval, 10.0)
+        receiver.telnet_healthy = False
+        await poller.poll()
+        self.assertEqual(10.0, poller.interval)
+
+    async def test_reset_on_newly_active_receiver(self):
+        receiver1 = FakeReceiver("avr1")
+        receiver2 = FakeReceiver("avr2", active=False)
+        poller = self._build_poller([receiver1, receiver2])
+        for _ in range(5):
+            await poller.poll()
+        self.assertGreater(poller.interval, 10.0)
+        receiver2.active = True
+        await poller.poll()
+        self.assertEqual(10.0, poller.interval)
+
+    async def test_no_backoff_without_active_receivers(self):
+        poller = self._build_poller([FakeReceiver("avr1", active=False)])
+        for _ in range(5):
+            await poller.poll()
+        self.assertEqual(10.0, poller.interval)
+
+    async def test_wakeup_starts_next_poll_cycle(self):
+        receiver = FakeReceiver("avr1")
+        poller = ReceiverStatusPoller(lambda: [receiver], min_interval=100.0, max_interval=100.0)
+        task = asyncio.create_task(poller.run())
+        try:
+            await asyncio.sleep(0.01)
+            self.assertEqual(1, receiver.async_update_receiver_data.await_count)
+            poller.wakeup()
+            await asyncio.sleep(0.01)
+            self.assertEqual(2, receiver.async_update_receiver_data.await_count)
+        finally:
+            task.cancel()
@@ -48,6 +48,11 @@ class TestSimpleCommandMappings(unittest.TestCase):
         self.assertTrue(marantz_specific_found, "No Marantz-specific command found")
         self.assertFalse(denon_specific_found, "Denon-specific command found for Marantz device")
 
+    def test_get_simple_commands_is_shared_per_device_type(self):
+        commands = simplecommand.get_simple_commands(self.DummyDevice(is_denon=True, use_telnet=True))
+        self.assertIs(commands, simplecommand.get_simple_commands(self.DummyDevice(is_denon=True, use_telnet=True)))
+        self.assertIsNot(commands, simplecommand.get_simple_commands(self.DummyDevice(is_denon=True, use_telnet=False)))
+
 
 class TestImaxPassFilterArgs(unittest.IsolatedAsyncioTestCase):
     def _build_command(self):